@@ -1,6 +1,5 @@
 from flask import Flask, request, jsonify
-import os
-from pi_transfer_script import PiNetworkTransferBot  # Your script
+from tasks import celery_app, start_monitoring, get_running_job_id
 
 app = Flask(__name__)
 
@@ -12,19 +11,25 @@ def handle_transfer():
     if not access_token:
         return jsonify({"error": "No access token"}), 400
 
-    # Set required environment variables
-    os.environ['PI_ACCESS_TOKEN'] = access_token
-    os.environ['ALLOWED_RECIPIENT_ADDRESS'] = 'pi_1abc234...yourrecipient'
-    os.environ['PI_APP_ID'] = 'your_app_id_here'
-    os.environ['PI_APP_SECRET'] = 'your_app_secret_here'
-    os.environ['PI_SANDBOX_MODE'] = 'true'  # Use sandbox mode for safety
-
+    # Monitoring can run for hours, so hand it to a Celery worker and return right away
     try:
-        bot = PiNetworkTransferBot()
-        success = bot.check_and_transfer()
-        return jsonify({"success": success}), 200 if success else 500
+        job_id = start_monitoring(access_token)
+        if job_id is None:
+            return jsonify({
+                "error": "Monitoring already running for this token",
+                "job_id": get_running_job_id(access_token)
+            }), 409
+        return jsonify({"job_id": job_id}), 202
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
+@app.route('/transfer/<job_id>', methods=['GET'])
+def get_transfer_status(job_id):
+    result = celery_app.AsyncResult(job_id)
+
+    # The task returns whether the transfer completed; only report it once it has finished
+    success = result.result if result.successful() else None
+    return jsonify({"job_id": job_id, "status": result.status, "success": success}), 200
+
 if __name__ == '__main__':
     app.run(host='0.0.0.0', port=5000)
\ No newline at end of file
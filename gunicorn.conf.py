@@ -0,0 +1,17 @@
+# Gunicorn configuration: gunicorn -c gunicorn.conf.py app:app
+import os
+
+bind = os.getenv('BIND', '0.0.0.0:5000')
+
+# Several worker processes to use every core
+workers = int(os.getenv('GUNICORN_WORKERS', '4'))
+
+# Threaded workers; requests only queue Celery jobs or read their status, so they are short
+worker_class = 'gthread'
+threads = int(os.getenv('GUNICORN_THREADS', '25'))
+
+def post_fork(server, worker):
+    # Start the queued file/console logging in each worker; its listener thread
+    # would not survive the fork if it were started in the master
+    from pi_transfer_script import configure_logging
+    configure_logging()
\ No newline at end of file
@@ -1,44 +1,114 @@
 import os
 import time
+import atexit
+import queue
 import logging
-import requests
+from logging.handlers import QueueHandler, QueueListener
+import httpx
 from datetime import datetime, timezone
-from typing import Optional, Dict, Any, List
-import json
+from typing import Optional, Dict, Any, List, Awaitable, Callable, TypeVar
+import orjson
 import asyncio
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
+logger = logging.getLogger(__name__)
+
+# Background thread writing queued log records, and the process that started it
+_log_listener: Optional[QueueListener] = None
+_log_listener_pid: Optional[int] = None
+
+def configure_logging() -> None:
+    """Queue log records and write them to file/console from a background thread.
+
+    Call once per process. Forked children must call it again, since the listener
+    thread is not inherited across fork.
+    """
+    global _log_listener, _log_listener_pid
+    if _log_listener is not None and _log_listener_pid == os.getpid():
+        return
+    
+    log_queue = queue.Queue(-1)
+    _log_listener = QueueListener(
+        log_queue,
         logging.FileHandler('pi_transfer.log'),
         logging.StreamHandler()
-    ]
-)
-logger = logging.getLogger(__name__)
+    )
+    _log_listener.start()
+    _log_listener_pid = os.getpid()
+    atexit.register(shutdown_logging)
+    
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s',
+        handlers=[QueueHandler(log_queue)],
+        force=True
+    )
+
+def shutdown_logging() -> None:
+    """Flush queued log records and stop this process's listener thread."""
+    global _log_listener
+    if _log_listener is not None and _log_listener_pid == os.getpid():
+        _log_listener.stop()
+        _log_listener = None
+
+T = TypeVar('T')
 
 class PiNetworkTransferBot:
 
-    def __init__(self):
-        """Initialize the Pi Network transfer bot with configuration validation."""
+    def __init__(
+        self,
+        access_token: Optional[str] = None,
+        recipient: Optional[str] = None,
+        app_id: Optional[str] = None,
+        app_secret: Optional[str] = None,
+        sandbox: Optional[bool] = None
+    ):
+        """Initialize the Pi Network transfer bot with configuration validation.
+
+        Arguments that are not given fall back to the matching environment variables.
+        """
         self.TRANSFER_AMOUNT = 1650.0  # Pi to transfer
         self.TRANSACTION_FEE = 0.01    # Estimated transaction fee
         self.REQUIRED_BALANCE = self.TRANSFER_AMOUNT + self.TRANSACTION_FEE
         
+        # Payment status polling: exponential backoff from 1s, capped at 30s, for up to 10 minutes
+        self.POLL_INITIAL_DELAY = 1.0
+        self.POLL_MAX_DELAY = 30.0
+        self.POLL_TIMEOUT = 600.0
+        
+        # Upper bound on pending payments completed in parallel
+        self.MAX_CONCURRENT_COMPLETIONS = 10
+        
+        # GET retries on transient HTTP statuses: 3 retries with 0.3s, 0.6s, 1.2s backoff
+        self.RETRY_STATUSES = {429, 502, 503, 504}
+        self.MAX_RETRIES = 3
+        self.RETRY_BACKOFF = 0.3
+        
         # Target execution time: July 20, 2025, at 3:38:09 PM UTC
         self.TARGET_DATETIME = datetime(2025, 7, 20, 15, 38, 9, tzinfo=timezone.utc)
         
-        # Load configuration from environment variables
+        # Payment memo and metadata only depend on the target time, so build them once
+        self._target_iso = self.TARGET_DATETIME.isoformat()
+        self._memo_template = f"Automated transfer of {{amount}} Pi - Scheduled for {self.TARGET_DATETIME}"
+        self._scheduled_metadata = {
+            'transfer_type': 'automated_transfer',
+            'scheduled_time': self._target_iso
+        }
+        
+        # Target time as a POSIX timestamp, so checks are a float compare against time.time()
+        self._target_ts = self.TARGET_DATETIME.timestamp()
+        
+        # Load configuration from arguments, falling back to environment variables
         # For testing only - replace with actual values temporarily
-        self.access_token = os.getenv('PI_ACCESS_TOKEN', 'test_access_token_here')
-        self.allowed_recipient = os.getenv('ALLOWED_RECIPIENT_ADDRESS', 'test_wallet_address_here')
-        self.app_id = os.getenv('PI_APP_ID', 'test_app_id_here')
-        self.app_secret = os.getenv('PI_APP_SECRET', 'test_app_secret_here')
+        self.access_token = access_token or os.getenv('PI_ACCESS_TOKEN', 'test_access_token_here')
+        self.allowed_recipient = recipient or os.getenv('ALLOWED_RECIPIENT_ADDRESS', 'test_wallet_address_here')
+        self.app_id = app_id or os.getenv('PI_APP_ID', 'test_app_id_here')
+        self.app_secret = app_secret or os.getenv('PI_APP_SECRET', 'test_app_secret_here')
         
         # Pi Platform API configuration
         self.pi_api_base_url = os.getenv('PI_API_BASE_URL', 'https://api.minepi.com')
-        self.sandbox_mode = os.getenv('PI_SANDBOX_MODE', 'false').lower() == 'true'
+        if sandbox is None:
+            sandbox = os.getenv('PI_SANDBOX_MODE', 'false').lower() == 'true'
+        self.sandbox_mode = sandbox
         
         if self.sandbox_mode:
             self.pi_api_base_url = 'https://api.sandbox.minepi.com'
@@ -51,6 +121,15 @@ class PiNetworkTransferBot:
         self.wallet_address = None
         self.user_uid = None
         
+        # Request headers shared by every Platform API call
+        self._headers = {
+            'Authorization': f'Bearer {self.access_token}',
+            'Content-Type': 'application/json'
+        }
+        
+        # Shared HTTP/2 client for the async API helpers (created lazily)
+        self._client: Optional[httpx.AsyncClient] = None
+        
         logger.info(f"Pi Transfer Bot initialized")
         logger.info(f"Target transfer time: {self.TARGET_DATETIME}")
         logger.info(f"Allowed recipient: {self.allowed_recipient}")
@@ -59,16 +138,16 @@ class PiNetworkTransferBot:
     def _validate_configuration(self) -> None:
         """Validate all required configuration parameters."""
         if not self.access_token:
-            raise ValueError("PI_ACCESS_TOKEN environment variable is required")
+            raise ValueError("access_token (or PI_ACCESS_TOKEN) is required")
         
         if not self.allowed_recipient:
-            raise ValueError("ALLOWED_RECIPIENT_ADDRESS environment variable is required")
+            raise ValueError("recipient (or ALLOWED_RECIPIENT_ADDRESS) is required")
         
         if not self.app_id:
-            raise ValueError("PI_APP_ID environment variable is required")
+            raise ValueError("app_id (or PI_APP_ID) is required")
         
         if not self.app_secret:
-            raise ValueError("PI_APP_SECRET environment variable is required")
+            raise ValueError("app_secret (or PI_APP_SECRET) is required")
         
         # Validate recipient address format (Pi wallet address)
         if not self.allowed_recipient or len(self.allowed_recipient) < 20:
@@ -76,6 +155,17 @@ class PiNetworkTransferBot:
         
         logger.info("Configuration validation passed")
 
+    def _build_payment_data(self, recipient: str, amount: float, memo: str) -> Dict[str, Any]:
+        """Build the create-payment request body from the precomputed metadata."""
+        return {
+            'payment': {
+                'amount': amount,
+                'memo': memo,
+                'metadata': {**self._scheduled_metadata, 'recipient': recipient},
+                'uid': self.user_uid
+            }
+        }
+
     def _validate_recipient_address(self, recipient: str) -> bool:
         """Validate that the recipient address matches the allowed address."""
         if recipient != self.allowed_recipient:
@@ -84,22 +174,50 @@ class PiNetworkTransferBot:
             raise ValueError(error_msg)
         return True
 
-    def get_user_info(self) -> Optional[Dict[str, Any]]:
-        """Get authenticated user information using Platform API."""
-        try:
-            headers = {
-                'Authorization': f'Bearer {self.access_token}',
-                'Content-Type': 'application/json'
-            }
-            
-            response = requests.get(
-                f"{self.pi_api_base_url}/v2/me",
-                headers=headers,
-                timeout=30
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the shared HTTP/2 client, creating it on first use."""
+        if self._client is None or self._client.is_closed:
+            # Transport retries only cover connection failures (the request was never sent),
+            # so they are safe for POSTs too; status-based retries are in _get_with_retry
+            transport = httpx.AsyncHTTPTransport(
+                http2=True,
+                retries=self.MAX_RETRIES,
+                limits=httpx.Limits(max_connections=20, max_keepalive_connections=10)
+            )
+            self._client = httpx.AsyncClient(
+                transport=transport,
+                base_url=self.pi_api_base_url,
+                headers=self._headers,
+                timeout=30.0
             )
+        return self._client
+
+    async def _get_with_retry(self, url: str, **kwargs: Any) -> httpx.Response:
+        """Send a GET, retrying with exponential backoff on 429/502/503/504.
+
+        Only GETs are retried on status, so a payment is never created or approved twice.
+        """
+        client = self._get_client()
+        for attempt in range(self.MAX_RETRIES):
+            response = await client.get(url, **kwargs)
+            if response.status_code not in self.RETRY_STATUSES:
+                return response
+            await asyncio.sleep(self.RETRY_BACKOFF * (2 ** attempt))
+        return await client.get(url, **kwargs)
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP/2 client."""
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+        self._client = None
+
+    async def get_user_info_async(self) -> Optional[Dict[str, Any]]:
+        """Get authenticated user information using Platform API (async)."""
+        try:
+            response = await self._get_with_retry('/v2/me')
             
             if response.status_code == 200:
-                user_data = response.json()
+                user_data = orjson.loads(response.content)
                 logger.info(f"User authenticated: {user_data.get('username', 'N/A')}")
                 
                 # Store user information
@@ -111,154 +229,118 @@ class PiNetworkTransferBot:
                 logger.error(f"Failed to get user info: HTTP {response.status_code}")
                 return None
                 
-        except requests.RequestException as e:
+        except (httpx.HTTPError, orjson.JSONDecodeError) as e:
             logger.error(f"Error fetching user info: {e}")
             return None
 
-    def get_wallet_balance(self) -> Optional[Dict[str, Any]]:
-        """Get the current wallet balance using Platform API."""
+    async def get_wallet_balance_async(self) -> Optional[Dict[str, Any]]:
+        """Get the current wallet balance using Platform API (async)."""
         if not self.wallet_address:
             logger.error("Wallet address not available. Please authenticate first.")
             return None
             
         try:
-            headers = {
-                'Authorization': f'Bearer {self.access_token}',
-                'Content-Type': 'application/json'
-            }
-            
-            # Use Platform API to get wallet balance
-            response = requests.get(
-                f"{self.pi_api_base_url}/v2/wallets/{self.wallet_address}/balance",
-                headers=headers,
-                timeout=30
-            )
+            response = await self._get_with_retry(f'/v2/wallets/{self.wallet_address}/balance')
             
             if response.status_code == 200:
-                balance_data = response.json()
+                balance_data = orjson.loads(response.content)
                 logger.info(f"Balance retrieved: {balance_data}")
                 return balance_data
             else:
                 logger.error(f"Failed to get balance: HTTP {response.status_code}")
                 return None
                 
-        except requests.RequestException as e:
+        except (httpx.HTTPError, orjson.JSONDecodeError) as e:
             logger.error(f"Error fetching balance: {e}")
             return None
 
-    def get_available_balance(self) -> float:
-        """Get the available (unlocked) Pi balance."""
-        balance_data = self.get_wallet_balance()
+    async def get_available_balance_async(self) -> float:
+        """Get the available (unlocked) Pi balance (async)."""
+        balance_data = await self.get_wallet_balance_async()
         if balance_data:
-            # Pi Network balance structure
             available = balance_data.get('available', 0)
             return float(available)
         return 0.0
 
-    def get_pending_payments(self) -> Optional[List[Dict[str, Any]]]:
-        """Get pending payments for the user."""
+    async def get_pending_payments_async(self) -> Optional[List[Dict[str, Any]]]:
+        """Get pending payments for the user (async)."""
         try:
-            headers = {
-                'Authorization': f'Bearer {self.access_token}',
-                'Content-Type': 'application/json'
-            }
-            
-            response = requests.get(
-                f"{self.pi_api_base_url}/v2/payments",
-                headers=headers,
-                params={'status': 'pending'},
-                timeout=30
-            )
+            response = await self._get_with_retry('/v2/payments', params={'status': 'pending'})
             
             if response.status_code == 200:
-                payments_data = response.json()
+                payments_data = orjson.loads(response.content)
                 return payments_data.get('payments', [])
             else:
                 logger.error(f"Failed to get pending payments: HTTP {response.status_code}")
                 return None
                 
-        except requests.RequestException as e:
+        except (httpx.HTTPError, orjson.JSONDecodeError) as e:
             logger.error(f"Error fetching pending payments: {e}")
             return None
 
-    def confirm_unlock(self) -> bool:
-        """Attempt to confirm unlock of locked Pi tokens via pending payments."""
+    async def _complete_payment_async(self, payment_id: str) -> bool:
+        """Complete a payment using Platform API (async)."""
         try:
-            pending_payments = self.get_pending_payments()
+            response = await self._get_client().post(f'/v2/payments/{payment_id}/complete')
             
-            if not pending_payments:
-                return True  # No pending payments to confirm
-            
-            # Process any incomplete payments that might be related to unlocking
-            for payment in pending_payments:
-                if not payment.get('status', {}).get('developer_completed', True):
-                    payment_id = payment.get('identifier')
-                    
-                    # Complete the payment if it's related to unlocking
-                    if self._complete_payment(payment_id):
-                        logger.info(f"Completed pending payment: {payment_id}")
-                    else:
-                        logger.warning(f"Failed to complete pending payment: {payment_id}")
+            return response.status_code == 200
             
-            return True
-                
-        except Exception as e:
-            logger.warning(f"Error confirming unlock: {e}")
+        except httpx.HTTPError as e:
+            logger.error(f"Error completing payment {payment_id}: {e}")
             return False
 
-    def _complete_payment(self, payment_id: str) -> bool:
-        """Complete a payment using Platform API."""
+    async def confirm_unlock_async(self) -> bool:
+        """Confirm unlock of locked Pi tokens, completing pending payments concurrently."""
         try:
-            headers = {
-                'Authorization': f'Bearer {self.access_token}',
-                'Content-Type': 'application/json'
-            }
+            pending_payments = await self.get_pending_payments_async()
+            
+            if not pending_payments:
+                return True  # No pending payments to confirm
+            
+            payment_ids = [
+                payment.get('identifier')
+                for payment in pending_payments
+                if not payment.get('status', {}).get('developer_completed', True)
+            ]
             
-            response = requests.post(
-                f"{self.pi_api_base_url}/v2/payments/{payment_id}/complete",
-                headers=headers,
-                timeout=30
+            # Complete incomplete payments concurrently, at most MAX_CONCURRENT_COMPLETIONS at a time
+            semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_COMPLETIONS)
+            
+            async def complete(payment_id: str) -> bool:
+                async with semaphore:
+                    return await self._complete_payment_async(payment_id)
+            
+            results = await asyncio.gather(
+                *(complete(payment_id) for payment_id in payment_ids),
+                return_exceptions=True
             )
             
-            return response.status_code == 200
+            for payment_id, completed in zip(payment_ids, results):
+                if isinstance(completed, Exception):
+                    logger.warning(f"Error completing pending payment {payment_id}: {completed}")
+                elif completed:
+                    logger.info(f"Completed pending payment: {payment_id}")
+                else:
+                    logger.warning(f"Failed to complete pending payment: {payment_id}")
             
-        except requests.RequestException as e:
-            logger.error(f"Error completing payment {payment_id}: {e}")
+            return True
+                
+        except Exception as e:
+            logger.warning(f"Error confirming unlock: {e}")
             return False
 
-    def create_payment(self, recipient: str, amount: float, memo: str) -> Optional[str]:
-        """Create a new payment using Platform API."""
+    async def create_payment_async(self, recipient: str, amount: float, memo: str) -> Optional[str]:
+        """Create a new payment using Platform API (async)."""
         try:
             # Validate recipient address
             self._validate_recipient_address(recipient)
             
-            headers = {
-                'Authorization': f'Bearer {self.access_token}',
-                'Content-Type': 'application/json'
-            }
-            
-            payment_data = {
-                'payment': {
-                    'amount': amount,
-                    'memo': memo,
-                    'metadata': {
-                        'transfer_type': 'automated_transfer',
-                        'scheduled_time': self.TARGET_DATETIME.isoformat(),
-                        'recipient': recipient
-                    },
-                    'uid': self.user_uid
-                }
-            }
+            payment_data = self._build_payment_data(recipient, amount, memo)
             
-            response = requests.post(
-                f"{self.pi_api_base_url}/v2/payments",
-                headers=headers,
-                json=payment_data,
-                timeout=30
-            )
+            response = await self._get_client().post('/v2/payments', content=orjson.dumps(payment_data))
             
             if response.status_code in [200, 201]:
-                payment_response = response.json()
+                payment_response = orjson.loads(response.content)
                 payment_id = payment_response.get('identifier')
                 logger.info(f"Payment created successfully: {payment_id}")
                 return payment_id
@@ -270,19 +352,10 @@ class PiNetworkTransferBot:
             logger.error(f"Error creating payment: {e}")
             return None
 
-    def approve_payment(self, payment_id: str) -> bool:
-        """Approve a payment using Platform API."""
+    async def approve_payment_async(self, payment_id: str) -> bool:
+        """Approve a payment using Platform API (async)."""
         try:
-            headers = {
-                'Authorization': f'Bearer {self.access_token}',
-                'Content-Type': 'application/json'
-            }
-            
-            response = requests.post(
-                f"{self.pi_api_base_url}/v2/payments/{payment_id}/approve",
-                headers=headers,
-                timeout=30
-            )
+            response = await self._get_client().post(f'/v2/payments/{payment_id}/approve')
             
             if response.status_code == 200:
                 logger.info(f"Payment approved: {payment_id}")
@@ -291,108 +364,99 @@ class PiNetworkTransferBot:
                 logger.error(f"Failed to approve payment: HTTP {response.status_code}")
                 return False
                 
-        except requests.RequestException as e:
+        except httpx.HTTPError as e:
             logger.error(f"Error approving payment {payment_id}: {e}")
             return False
 
-    def complete_payment(self, payment_id: str, txid: str = None) -> bool:
-        """Complete a payment using Platform API."""
-        return self._complete_payment(payment_id)
+    async def get_payment_status_async(self, payment_id: str) -> Optional[Dict[str, Any]]:
+        """Get payment status using Platform API (async)."""
+        try:
+            response = await self._get_with_retry(f'/v2/payments/{payment_id}')
+            
+            if response.status_code == 200:
+                return orjson.loads(response.content)
+            else:
+                logger.error(f"Failed to get payment status: HTTP {response.status_code}")
+                return None
+                
+        except (httpx.HTTPError, orjson.JSONDecodeError) as e:
+            logger.error(f"Error getting payment status: {e}")
+            return None
 
-    def execute_transfer(self, recipient: str, amount: float) -> bool:
-        """Execute the Pi transfer using Platform API payment flow."""
+    async def execute_transfer_async(self, recipient: str, amount: float) -> bool:
+        """Execute the Pi transfer using Platform API payment flow (async)."""
         try:
             logger.info(f"Initiating transfer of {amount} Pi to {recipient}")
             
             # Step 1: Create payment
-            memo = f"Automated transfer of {amount} Pi - Scheduled for {self.TARGET_DATETIME}"
-            payment_id = self.create_payment(recipient, amount, memo)
+            memo = self._memo_template.format(amount=amount)
+            payment_id = await self.create_payment_async(recipient, amount, memo)
             
             if not payment_id:
                 logger.error("Failed to create payment")
                 return False
             
             # Step 2: Approve payment (server-side approval)
-            if not self.approve_payment(payment_id):
+            if not await self.approve_payment_async(payment_id):
                 logger.error("Failed to approve payment")
                 return False
             
             # Step 3: Monitor payment status and complete when ready
-            max_attempts = 60  # Monitor for up to 10 minutes
-            attempt = 0
-            
-            while attempt < max_attempts:
-                payment_status = self.get_payment_status(payment_id)
-                
-                if payment_status:
-                    status = payment_status.get('status', {})
-                    
-                    if status.get('transaction_verified') and not status.get('developer_completed'):
-                        # Transaction is verified, complete the payment
-                        txid = payment_status.get('transaction', {}).get('txid')
-                        if self.complete_payment(payment_id, txid):
-                            logger.info(f"Transfer completed successfully! Payment ID: {payment_id}")
-                            return True
-                    
-                    if status.get('cancelled') or status.get('user_cancelled'):
-                        logger.error(f"Payment was cancelled: {payment_id}")
-                        return False
-                
-                attempt += 1
-                time.sleep(10)  # Wait 10 seconds before checking again
-            
-            logger.error(f"Payment completion timeout for payment: {payment_id}")
-            return False
+            return await self._poll_and_complete_payment_async(payment_id)
                 
         except Exception as e:
             logger.error(f"Unexpected error during transfer: {e}")
             return False
 
-    def get_payment_status(self, payment_id: str) -> Optional[Dict[str, Any]]:
-        """Get payment status using Platform API."""
-        try:
-            headers = {
-                'Authorization': f'Bearer {self.access_token}',
-                'Content-Type': 'application/json'
-            }
-            
-            response = requests.get(
-                f"{self.pi_api_base_url}/v2/payments/{payment_id}",
-                headers=headers,
-                timeout=30
-            )
+    async def _poll_and_complete_payment_async(self, payment_id: str) -> bool:
+        """Monitor payment status and complete the payment once the transaction is verified."""
+        # Poll with exponential backoff for up to 10 minutes
+        delay = self.POLL_INITIAL_DELAY
+        deadline = time.monotonic() + self.POLL_TIMEOUT
+        
+        while time.monotonic() < deadline:
+            payment_status = await self.get_payment_status_async(payment_id)
             
-            if response.status_code == 200:
-                return response.json()
-            else:
-                logger.error(f"Failed to get payment status: HTTP {response.status_code}")
-                return None
+            if payment_status:
+                status = payment_status.get('status', {})
                 
-        except requests.RequestException as e:
-            logger.error(f"Error getting payment status: {e}")
-            return None
+                if status.get('transaction_verified') and not status.get('developer_completed'):
+                    # Transaction is verified, complete the payment
+                    if await self._complete_payment_async(payment_id):
+                        logger.info(f"Transfer completed successfully! Payment ID: {payment_id}")
+                        return True
+                
+                if status.get('cancelled') or status.get('user_cancelled'):
+                    logger.error(f"Payment was cancelled: {payment_id}")
+                    return False
+            
+            await asyncio.sleep(delay)
+            delay = min(delay * 1.5, self.POLL_MAX_DELAY)
+        
+        logger.error(f"Payment completion timeout for payment: {payment_id}")
+        return False
 
-    def check_and_transfer(self) -> bool:
-        """Check balance and execute transfer if conditions are met."""
+    async def check_and_transfer_async(self) -> bool:
+        """Check balance and execute transfer if conditions are met (async)."""
         try:
             # First, ensure user is authenticated
             if not self.wallet_address:
-                user_info = self.get_user_info()
+                user_info = await self.get_user_info_async()
                 if not user_info:
                     logger.error("Failed to authenticate user")
                     return False
             
             # Attempt to confirm any pending unlocks
-            self.confirm_unlock()
+            await self.confirm_unlock_async()
             
             # Check available balance
-            available_balance = self.get_available_balance()
+            available_balance = await self.get_available_balance_async()
             logger.info(f"Current available balance: {available_balance} Pi")
             
             if available_balance >= self.REQUIRED_BALANCE:
                 logger.info(f"Sufficient balance available. Executing transfer...")
                 
-                success = self.execute_transfer(self.allowed_recipient, self.TRANSFER_AMOUNT)
+                success = await self.execute_transfer_async(self.allowed_recipient, self.TRANSFER_AMOUNT)
                 
                 if success:
                     logger.info("Transfer completed successfully!")
@@ -409,42 +473,62 @@ class PiNetworkTransferBot:
             logger.error(f"Error in check_and_transfer: {e}")
             return False
 
+    async def _run_and_close(self, coro: Awaitable[T]) -> T:
+        """Await an API coroutine and release the client bound to this event loop."""
+        try:
+            return await coro
+        finally:
+            await self.aclose()
+
+    def authenticate(self) -> bool:
+        """Fetch the authenticated user's uid and wallet address."""
+        return asyncio.run(self._run_and_close(self.get_user_info_async())) is not None
+
+    def check_and_transfer(self) -> bool:
+        """Check balance and execute transfer if conditions are met."""
+        return asyncio.run(self._run_and_close(self.check_and_transfer_async()))
+
     def is_target_time_reached(self) -> bool:
         """Check if the target execution time has been reached."""
-        current_time = datetime.now(timezone.utc)
-        return current_time >= self.TARGET_DATETIME
+        return time.time() >= self._target_ts
+
+    def run_monitoring_loop(self, heartbeat: Optional[Callable[[], bool]] = None) -> bool:
+        """Main monitoring loop that runs until successful transfer or target time.
 
-    def run_monitoring_loop(self) -> None:
-        """Main monitoring loop that runs until successful transfer or target time."""
+        heartbeat, if given, is called before every check; returning False stops the loop.
+        Returns True if the transfer completed.
+        """
         logger.info("Starting balance monitoring loop...")
         
         # Initial authentication
-        if not self.get_user_info():
+        if not self.authenticate():
             logger.error("Failed to authenticate. Exiting...")
-            return
+            return False
         
         while True:
+            if heartbeat is not None and not heartbeat():
+                logger.error("Monitoring heartbeat failed. Exiting...")
+                return False
+            
             try:
-                current_time = datetime.now(timezone.utc)
-                
                 # Check if target time has passed
                 if self.is_target_time_reached():
                     logger.info("Target time reached. Attempting final transfer...")
                     
                     if self.check_and_transfer():
                         logger.info("Final transfer successful. Exiting...")
-                        break
+                        return True
                     else:
                         logger.error("Final transfer failed at target time")
-                        break
+                        return False
                 
                 # Regular balance check
                 if self.check_and_transfer():
                     logger.info("Transfer successful before target time. Exiting...")
-                    break
+                    return True
                 
                 # Calculate time until target
-                time_until_target = (self.TARGET_DATETIME - current_time).total_seconds()
+                time_until_target = self._target_ts - time.time()
                 
                 if time_until_target > 300:  # More than 5 minutes until target
                     # Wait 5 minutes before next check
@@ -457,7 +541,7 @@ class PiNetworkTransferBot:
                 
             except KeyboardInterrupt:
                 logger.info("Monitoring stopped by user")
-                break
+                return False
             except Exception as e:
                 logger.error(f"Error in monitoring loop: {e}")
                 time.sleep(60)  # Wait 1 minute before retrying on error
@@ -473,6 +557,8 @@ class PiNetworkTransferBot:
 
 def main():
     """Main function to run the Pi Network transfer bot."""
+    configure_logging()
+    
     try:
         # Initialize the transfer bot
         bot = PiNetworkTransferBot()
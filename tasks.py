@@ -0,0 +1,95 @@
+import os
+import uuid
+import hashlib
+from typing import Optional
+import redis
+from celery import Celery
+from celery.signals import worker_init, worker_process_init, worker_process_shutdown
+from pi_transfer_script import PiNetworkTransferBot, configure_logging, shutdown_logging
+
+BROKER_URL = os.getenv('CELERY_BROKER_URL', 'redis://localhost:6379/0')
+
+# Background workers: celery -A tasks worker
+celery_app = Celery(
+    'pi',
+    broker=BROKER_URL,
+    backend=os.getenv('CELERY_RESULT_BACKEND', 'redis://localhost:6379/0')
+)
+
+# Keep the bot's queued file/console logging instead of Celery's root logger setup
+celery_app.conf.worker_hijack_root_logger = False
+
+@worker_init.connect
+@worker_process_init.connect
+def init_worker_logging(**kwargs):
+    # Runs in the main worker process and again in each forked pool process,
+    # which needs its own listener thread
+    configure_logging()
+
+@worker_process_shutdown.connect
+def shutdown_worker_logging(**kwargs):
+    shutdown_logging()
+
+# Transfer configuration, loaded here so it never travels through the broker
+ALLOWED_RECIPIENT_ADDRESS = 'pi_1abc234...yourrecipient'
+PI_APP_ID = 'your_app_id_here'
+PI_APP_SECRET = 'your_app_secret_here'
+PI_SANDBOX_MODE = True  # Use sandbox mode for safety
+
+# At most one monitoring job per access token. The running job refreshes the lock
+# on every loop iteration (each takes well under an hour), so it only expires if
+# the worker dies or the job waits in the queue for longer than this.
+MONITOR_LOCK_TTL = 60 * 60
+redis_client = redis.Redis.from_url(BROKER_URL)
+
+def _monitor_lock_key(access_token: str) -> str:
+    # Hash the token so it is not stored in Redis key names
+    return 'pi:monitor:' + hashlib.sha256(access_token.encode()).hexdigest()
+
+def start_monitoring(access_token: str) -> Optional[str]:
+    """Queue monitor_task for this token.
+
+    Returns the new job id, or None if a job for this token is already queued or running.
+    """
+    job_id = str(uuid.uuid4())
+    lock_key = _monitor_lock_key(access_token)
+
+    if not redis_client.set(lock_key, job_id, nx=True, ex=MONITOR_LOCK_TTL):
+        return None
+
+    try:
+        monitor_task.apply_async(args=(access_token,), task_id=job_id)
+    except Exception:
+        redis_client.delete(lock_key)
+        raise
+    return job_id
+
+def get_running_job_id(access_token: str) -> Optional[str]:
+    """Return the id of the monitoring job holding this token's lock, if any."""
+    job_id = redis_client.get(_monitor_lock_key(access_token))
+    return job_id.decode() if job_id else None
+
+@celery_app.task(bind=True)
+def monitor_task(self, access_token):
+    """Run the balance monitoring loop for one user. Returns True if the transfer completed."""
+    lock_key = _monitor_lock_key(access_token)
+    
+    def refresh_lock() -> bool:
+        # Keep the lock while we still own it; if it expired and another job took it, stop
+        if get_running_job_id(access_token) != self.request.id:
+            return False
+        return bool(redis_client.expire(lock_key, MONITOR_LOCK_TTL))
+    
+    try:
+        bot = PiNetworkTransferBot(
+            access_token=access_token,
+            recipient=ALLOWED_RECIPIENT_ADDRESS,
+            app_id=PI_APP_ID,
+            app_secret=PI_APP_SECRET,
+            sandbox=PI_SANDBOX_MODE
+        )
+        return bot.run_monitoring_loop(heartbeat=refresh_lock)
+    finally:
+        # Only release the lock if it is still ours (it may have expired and been retaken)
+        if get_running_job_id(access_token) == self.request.id:
+            redis_client.delete(lock_key)
\ No newline at end of file
@@ -0,0 +1,100 @@
+import httpx
+import orjson
+import pytest
+
+from pi_transfer_script import PiNetworkTransferBot
+
+RECIPIENT = 'pi_recipient_wallet_address_0001'
+
+def make_bot(balance, status_sequence=None):
+    """Build a bot whose Platform API calls are answered by an in-memory transport."""
+    bot = PiNetworkTransferBot(
+        access_token='token',
+        recipient=RECIPIENT,
+        app_id='app',
+        app_secret='secret',
+        sandbox=True
+    )
+    bot.POLL_INITIAL_DELAY = 0.0
+    
+    statuses = list(status_sequence or [{'transaction_verified': True, 'developer_completed': False}])
+    calls = []
+    
+    def handler(request):
+        calls.append((request.method, request.url.path))
+        path = request.url.path
+        
+        if path == '/v2/me':
+            body = {'uid': 'uid-1', 'username': 'pioneer', 'wallet_address': 'wallet-1'}
+        elif path == '/v2/wallets/wallet-1/balance':
+            body = {'available': balance}
+        elif path == '/v2/payments' and request.method == 'GET':
+            body = {'payments': [{'identifier': 'pending-1', 'status': {'developer_completed': False}}]}
+        elif path == '/v2/payments' and request.method == 'POST':
+            payment = orjson.loads(request.content)['payment']
+            assert payment['metadata']['recipient'] == RECIPIENT
+            body = {'identifier': 'payment-1'}
+        elif path == '/v2/payments/payment-1' and request.method == 'GET':
+            status = statuses.pop(0) if len(statuses) > 1 else statuses[0]
+            body = {'status': status, 'transaction': {'txid': 'tx-1'}}
+        else:
+            body = {}
+        return httpx.Response(200, content=orjson.dumps(body))
+    
+    bot._client = httpx.AsyncClient(
+        transport=httpx.MockTransport(handler),
+        base_url=bot.pi_api_base_url
+    )
+    return bot, calls
+
+def test_check_and_transfer_completes_payment():
+    bot, calls = make_bot(balance=2000)
+    
+    assert bot.check_and_transfer() is True
+    assert ('POST', '/v2/payments/pending-1/complete') in calls
+    assert ('POST', '/v2/payments') in calls
+    assert ('POST', '/v2/payments/payment-1/approve') in calls
+    assert calls[-1] == ('POST', '/v2/payments/payment-1/complete')
+
+def test_check_and_transfer_polls_until_verified():
+    pending = {'transaction_verified': False, 'developer_completed': False}
+    verified = {'transaction_verified': True, 'developer_completed': False}
+    bot, calls = make_bot(balance=2000, status_sequence=[pending, pending, verified])
+    
+    assert bot.check_and_transfer() is True
+    assert calls.count(('GET', '/v2/payments/payment-1')) == 3
+
+def test_check_and_transfer_insufficient_balance():
+    bot, calls = make_bot(balance=10)
+    
+    assert bot.check_and_transfer() is False
+    assert ('POST', '/v2/payments') not in calls
+
+def test_run_monitoring_loop_stops_when_heartbeat_fails():
+    bot, calls = make_bot(balance=2000)
+    
+    assert bot.run_monitoring_loop(heartbeat=lambda: False) is False
+    assert calls == [('GET', '/v2/me')]
+
+def test_get_requests_retry_transient_statuses():
+    bot = PiNetworkTransferBot(
+        access_token='token',
+        recipient=RECIPIENT,
+        app_id='app',
+        app_secret='secret',
+        sandbox=True
+    )
+    bot.RETRY_BACKOFF = 0.0
+    responses = [503, 429, 200]
+    
+    def handler(request):
+        return httpx.Response(responses.pop(0), content=orjson.dumps({'uid': 'uid-1', 'wallet_address': 'wallet-1'}))
+    
+    bot._client = httpx.AsyncClient(
+        transport=httpx.MockTransport(handler),
+        base_url=bot.pi_api_base_url
+    )
+    
+    assert bot.authenticate() is True
+    assert bot.wallet_address == 'wallet-1'
+    assert responses == []
\ No newline at end of file